@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import os
+import secrets
+import stat
+import tomllib
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
+from functools import cache
 from logging import getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
-import keyring
-import toml
 from astrbot_canary_api import IAstrbotConfigEntry
 from astrbot_canary_api.exceptions import (
     SecretError,
 )
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Generator
@@ -20,10 +23,76 @@ if TYPE_CHECKING:
 
 logger = getLogger("astrbot.module.core.config")
 
+# toml(写入) 与 keyring 仅在保存配置/存取密钥时才导入
+
 __all__ = ["AstrbotConfigEntry"]
 
 T = TypeVar("T", bound=BaseModel)
 
+
+def _cfg_file(cfg_dir: Path, group: str, name: str) -> Path:
+    """配置项对应的文件路径.
+
+    相对路径依赖当前工作目录(AstrbotPaths.chdir 会切换), 先转为绝对路径再查缓存.
+    缓存键还包含 cfg_dir 实际指向的目录(设备号, inode): 根目录被重新指定
+    (AstrbotPaths.init/reload 或符号链接改指)后不会沿用旧的解析结果.
+    目录尚不存在时直接解析, 不缓存.
+    """
+    cfg_dir = cfg_dir.absolute()
+    try:
+        st = cfg_dir.stat()
+    except OSError:
+        return (cfg_dir / group / f"{name}.toml").resolve()
+    return _resolve_cfg_file(cfg_dir, st.st_dev, st.st_ino, group, name)
+
+
+@cache
+def _resolve_cfg_file(
+    cfg_dir: Path,
+    st_dev: int,  # noqa: ARG001
+    st_ino: int,  # noqa: ARG001
+    group: str,
+    name: str,
+) -> Path:
+    """resolve 需要逐级访问文件系统, 按绝对路径与目录身份缓存结果."""
+    return (cfg_dir / group / f"{name}.toml").resolve()
+
+
+# 配置文件 -> (修改时间, 大小, 解析结果); 文件未变化时跳过读取与解析
+_PARSE_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _read_toml(cfg_file: Path) -> dict[str, Any] | None:
+    """一次读入整个配置文件并解析, 文件不存在时返回 None.
+
+    返回的字典会被缓存复用, 调用方不可修改.
+    """
+    try:
+        st = cfg_file.stat()
+    except FileNotFoundError:
+        _PARSE_CACHE.pop(cfg_file, None)
+        return None
+    cached = _PARSE_CACHE.get(cfg_file)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    try:
+        raw = cfg_file.read_bytes()
+    except FileNotFoundError:
+        return None
+    data = tomllib.loads(raw.decode("utf-8"))
+    _PARSE_CACHE[cfg_file] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _drop_none(data: dict[str, Any]) -> dict[str, Any]:
+    """按 toml 写入的规则去掉值为 None 的键, 使结果可与文件解析结果比较."""
+    return {
+        key: _drop_none(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+        if value is not None
+    }
+
+
 class AstrbotConfigEntry(IAstrbotConfigEntry[T], BaseModel):
     # type parameter T is used for value/default
     name: str
@@ -32,11 +101,18 @@ class AstrbotConfigEntry(IAstrbotConfigEntry[T], BaseModel):
     default: T
     description: str
     cfg_file: Path | None = Field(default=None, exclude=True)
+    _saved: dict[str, Any] | None = PrivateAttr(default=None)
+    """文件中当前的内容(解析结果或最近一次写入的数据), 未变化时跳过写入."""
 
     model_config: ClassVar[ConfigDict] = ConfigDict(
         arbitrary_types_allowed=True,
     )
 
+    def model_post_init(self, context: Any, /) -> None:  # noqa: ANN401
+        """由文件构造时, 通过校验上下文记录文件原始内容."""
+        if isinstance(context, dict):
+            self._saved = context.get("saved")
+
     @classmethod
     def bind(
         cls,
@@ -47,19 +123,12 @@ class AstrbotConfigEntry(IAstrbotConfigEntry[T], BaseModel):
         cfg_dir: Path,
     ) -> AstrbotConfigEntry[T]:
         """工厂方法:优先从文件加载,否则新建并保存.自动根据default类型推断模型类型."""
-        cfg_file: Path = (cfg_dir / f"{group}" / f"{name}.toml").resolve()
+        cfg_file: Path = _cfg_file(cfg_dir, group, name)
         # 自动推断模型类型
         model_type = type(default)
-        if cfg_file.exists():
-            with cfg_file.open("r", encoding="utf-8") as f:
-                data = toml.load(f)
-            # 仅当value/default为dict时才反序列化
-            if "value" in data and isinstance(data["value"], dict):
-                data["value"] = model_type.model_validate(data["value"])
-            if "default" in data and isinstance(data["default"], dict):
-                data["default"] = model_type.model_validate(data["default"])
-
-            entry = cls.model_validate(data)
+        cached = _read_toml(cfg_file)
+        if cached is not None:
+            entry = cls._from_file_data(cached, model_type)
             entry.cfg_file = cfg_file
             return entry
 
@@ -77,27 +146,77 @@ class AstrbotConfigEntry(IAstrbotConfigEntry[T], BaseModel):
         entry.save()
         return entry
 
+    @classmethod
+    def _from_file_data(
+        cls,
+        cached: dict[str, Any],
+        model_type: type[T],
+    ) -> AstrbotConfigEntry[T]:
+        """由文件解析结果构造配置项, value/default 按 model_type 反序列化.
+
+        文件原始内容记录为已保存状态: 模型结构变化(如新增字段)时 save 仍会重写.
+        """
+        # 浅拷贝, 不修改缓存中的解析结果
+        data = dict(cached)
+        # 仅当value/default为dict时才反序列化
+        if "value" in data and isinstance(data["value"], dict):
+            data["value"] = model_type.model_validate(data["value"])
+        if "default" in data and isinstance(data["default"], dict):
+            data["default"] = model_type.model_validate(data["default"])
+        return cls.model_validate(data, context={"saved": cached})
+
     def save(self) -> None:
-        """保存配置到 toml 文件(只用BaseModel标准序列化,Path等类型转为字符串)."""
+        """保存配置到 toml 文件(只用BaseModel标准序列化,Path等类型转为字符串).
+
+        读取使用标准库 tomllib; 写入仍用 toml, 它会跳过值为 None 的字段.
+        """
         if not self.cfg_file:
             logger.error("配置文件路径未设置,无法保存配置")
             return
+        # toml 会跳过值为 None 的键, 比较前同样去掉
+        data = _drop_none(self.model_dump(mode="json"))
+        if data == self._saved and self.cfg_file.exists():
+            return
         self.cfg_file.parent.mkdir(parents=True, exist_ok=True)
-        data = self.model_dump(mode="json")
-        with self.cfg_file.open("w", encoding="utf-8") as f:
-            _ = toml.dump(data, f)
+        import toml
+
+        payload = toml.dumps(data).encode("utf-8")
+        # 整体写入临时文件后原子替换, 中途失败不会留下半截配置
+        tmp = self.cfg_file.with_name(
+            f".{self.cfg_file.name}.{secrets.token_hex(8)}.tmp",
+        )
+        try:
+            # 沿用已有文件的权限, 避免放宽仅限本人读写(0600)的配置
+            mode: int | None = stat.S_IMODE(self.cfg_file.stat().st_mode)
+        except FileNotFoundError:
+            mode = None
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            # 缓冲写入会循环写完全部字节, 不会把短写的内容替换上去
+            with os.fdopen(fd, "wb") as f:
+                if mode is not None:
+                    os.fchmod(f.fileno(), mode)
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.cfg_file)  # noqa: PTH105
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        _PARSE_CACHE.pop(self.cfg_file, None)
+        self._saved = data
 
     def load(self) -> None:
         """从本地文件加载配置(覆盖当前值,只用BaseModel标准反序列化)."""
-        if self.cfg_file and self.cfg_file.exists():
-            with self.cfg_file.open("r", encoding="utf-8") as f:
-                data = toml.load(f)
-            loaded = type(self).model_validate(data)
-            self.value = loaded.value
-            self.default = loaded.default
-            self.description = loaded.description
-        else:
+        data = _read_toml(self.cfg_file) if self.cfg_file else None
+        if data is None:
             logger.warning("配置文件 %s 不存在,无法加载配置", self.cfg_file)
+            return
+        loaded = self._from_file_data(data, type(self.default))
+        self.value = loaded.value
+        self.default = loaded.default
+        self.description = loaded.description
+        self._saved = data
 
     def reset(self) -> None:
         """重置为默认值并保存."""
@@ -143,12 +262,16 @@ class AstrbotSecretKey(BaseModel):
         if self.key_id == "none":
             self.key_id = f"@{self.service}:{self.key_name}"
         if value:
+            import keyring
+
             keyring.set_password(self.service, self.key_id, value)
         self._secret = value
 
     @secret.deleter
     def secret(self) -> None:
         if self.key_id:
+            import keyring
+
             keyring.delete_password(self.service, self.key_id)
         self._secret = None
         self.key_id = "none"
@@ -164,6 +287,8 @@ class AstrbotSecretKey(BaseModel):
             if self.key_id == "none":
                 raise SecretError
             if self._secret is None:
+                import keyring
+
                 self._secret = keyring.get_password(self.service, self.key_id) or ""
             yield self._secret
         finally:
@@ -176,6 +301,8 @@ class AstrbotSecretKey(BaseModel):
             if self.key_id == "none":
                 raise SecretError
             if self._secret is None:
+                import keyring
+
                 self._secret = keyring.get_password(self.service, self.key_id) or ""
             yield self._secret
         finally:
@@ -2,44 +2,124 @@ from __future__ import annotations
 
 import os
 from contextlib import asynccontextmanager, contextmanager
+from functools import cache, lru_cache
 from os import getenv
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
 from astrbot_canary_api import IAstrbotPaths
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
 from packaging.utils import NormalizedName, canonicalize_name
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Generator
+    from collections.abc import AsyncGenerator, Callable, Generator
+
+_DEFAULT_ROOT: Path = Path.home() / ".astrbot"
+
+
+@lru_cache(maxsize=1)
+def _dotenv_path() -> str:
+    """查找 .env 文件, 只向上搜索一次."""
+    return find_dotenv()
+
+
+def _load_dotenv(last_mtime: float | None) -> float | None:
+    """仅当 .env 修改时间变化时重新解析, 返回本次的修改时间."""
+    dotenv_path = _dotenv_path()
+    if not dotenv_path:
+        return None
+    try:
+        mtime = Path(dotenv_path).stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if mtime != last_mtime:
+        # 首次加载不覆盖进程已有的环境变量; .env 修改后重新解析时以文件为准
+        load_dotenv(dotenv_path, override=last_mtime is not None)
+    return mtime
 
 
 class AstrbotPaths(IAstrbotPaths):
     """Class to manage and provide paths used by Astrbot Canary."""
 
-    _: bool = load_dotenv()
+    _dotenv_mtime: ClassVar[float | None] = None
+    _initialized: ClassVar[bool] = False
     astrbot_root: ClassVar[Path] = Path(
-        getenv("ASTRBOT_ROOT", Path.home() / ".astrbot")
+        getenv("ASTRBOT_ROOT", _DEFAULT_ROOT),
     ).absolute()
+    _unset_root: ClassVar[Path] = astrbot_root
+    """未被显式设置时的根目录对象, init 只替换这个默认值."""
+    _generation: ClassVar[int] = 0
+    """根目录版本号, reload 时递增, 各实例据此丢弃缓存的目录."""
 
     def __init__(self, name: str) -> None:
         self.name: str = name
+        # 已计算(且已确认存在)的目录, 按实例缓存; 新实例会重新检查并创建
+        self._dirs: dict[str, Path] = {}
+        self._dirs_generation: int = self._generation
         # 确保根目录存在
         self.astrbot_root.mkdir(parents=True, exist_ok=True)
 
+    @classmethod
+    def init(cls) -> None:
+        """加载 .env 并确定根目录, 仅执行一次.
+
+        不在导入时执行, 避免在导入锁内同步读取并解析 .env;
+        首次获取 Paths 实例时自动调用.
+        """
+        if cls._initialized:
+            return
+        cls._dotenv_mtime = _load_dotenv(None)
+        # 已显式设置的根目录(如 AstrbotPaths.astrbot_root = ...)不覆盖
+        if cls.astrbot_root is cls._unset_root:
+            cls.astrbot_root = Path(getenv("ASTRBOT_ROOT", _DEFAULT_ROOT)).absolute()
+        cls._initialized = True
+
     @classmethod
     def getPaths(cls, name: str) -> AstrbotPaths:
-        """返回Paths实例,用于访问模块的各类目录."""
-        normalized_name: NormalizedName = canonicalize_name(name)
-        instance: AstrbotPaths = cls(normalized_name)
-        instance.name = normalized_name
-        return instance
+        """返回Paths实例,用于访问模块的各类目录.
+
+        名称规范化后相同的模块(如 astrbot_canary 与 AstrBot-Canary)共享同一个实例
+        (仅缓存目录路径, reload 时统一失效).
+        """
+        cls.init()
+        return cls._shared(canonicalize_name(name))
+
+    @classmethod
+    @cache
+    def _shared(cls, name: NormalizedName) -> AstrbotPaths:
+        """按规范化名称缓存的共享实例."""
+        return cls(name)
+
+    def _cached(self, key: str, build: Callable[[], Path]) -> Path:
+        """按实例缓存目录, 根目录版本变化(reload)后重新计算."""
+        if self._dirs_generation != self._generation:
+            self._dirs.clear()
+            self._dirs_generation = self._generation
+        path = self._dirs.get(key)
+        if path is None:
+            path = self._dirs[key] = build()
+        return path
+
+    def _ensure_dir(self, *parts: str) -> Path:
+        """根目录下的子目录, 确保存在, 同一实例只创建一次."""
+
+        def build() -> Path:
+            path = self.astrbot_root.joinpath(*parts)
+            path.mkdir(parents=True, exist_ok=True)
+            return path
+
+        return self._cached(parts[0], build)
 
     @property
     def root(self) -> Path:
         """返回根目录."""
-        return (
-            self.astrbot_root if self.astrbot_root.exists() else Path.cwd() / ".astrbot"
+        return self._cached(
+            "root",
+            lambda: (
+                self.astrbot_root
+                if self.astrbot_root.exists()
+                else Path.cwd() / ".astrbot"
+            ),
         )
 
     @property
@@ -48,9 +128,7 @@ class AstrbotPaths(IAstrbotPaths):
 
         通过此属性获取模块/插件主目录.
         """
-        my_home = self.astrbot_root / "home" / self.name
-        my_home.mkdir(parents=True, exist_ok=True)
-        return my_home
+        return self._ensure_dir("home", self.name)
 
     @property
     def config(self) -> Path:
@@ -58,30 +136,27 @@ class AstrbotPaths(IAstrbotPaths):
 
         搭配 astrbot_canary_config 使用.
         """
-        config_path = self.astrbot_root / "config" / self.name
-        config_path.mkdir(parents=True, exist_ok=True)
-        return config_path
+        return self._ensure_dir("config", self.name)
 
     @property
     def data(self) -> Path:
         """返回模块数据目录."""
-        data_path = self.astrbot_root / "data" / self.name
-        data_path.mkdir(parents=True, exist_ok=True)
-        return data_path
+        return self._ensure_dir("data", self.name)
 
     @property
     def log(self) -> Path:
         """返回模块日志目录."""
-        log_path = self.astrbot_root / "logs" / self.name
-        log_path.mkdir(parents=True, exist_ok=True)
-        return log_path
+        return self._ensure_dir("logs", self.name)
 
     def reload(self) -> None:
-        """重新加载环境变量."""
-        load_dotenv()
-        self.__class__.astrbot_root = Path(
-            getenv("ASTRBOT_ROOT", Path.home() / ".astrbot")
-        ).absolute()
+        """重新加载环境变量.
+
+        根目录为类级别共享, 递增版本号使所有实例缓存的目录失效.
+        """
+        cls = self.__class__
+        cls._dotenv_mtime = _load_dotenv(cls._dotenv_mtime)
+        cls.astrbot_root = Path(getenv("ASTRBOT_ROOT", _DEFAULT_ROOT)).absolute()
+        cls._generation += 1
 
     @contextmanager
     def chdir(self, cwd: Path) -> Generator[Path]:
@@ -1,14 +1,58 @@
 from collections.abc import Iterable
 from importlib.metadata import EntryPoint, EntryPoints, entry_points
+from threading import Lock, Thread
+from typing import ClassVar
 
 
 class AstrbotCanaryHelper:
-    eps: EntryPoints = entry_points()
+    # 首次使用时才扫描入口点, 导入本模块不触发文件系统扫描
+    eps: EntryPoints | None = None
+    # 按组缓存 select 结果, refresh 时失效
+    _group_cache: ClassVar[dict[str, EntryPoints]] = {}
+    # 按 (组, 名字) 缓存单个入口点的查找结果(包括未找到)
+    _single_cache: ClassVar[dict[tuple[str, str], EntryPoint | None]] = {}
+    _load_lock: ClassVar[Lock] = Lock()
+    _prefetch_thread: ClassVar[Thread | None] = None
 
     @classmethod
-    def _ensure_loaded(cls, *, refresh: bool = False) -> None:
-        if refresh:
-            cls.eps = entry_points()
+    def _ensure_loaded(cls, *, refresh: bool = False) -> EntryPoints:
+        prefetch = cls._prefetch_thread
+        if prefetch is not None:
+            # 预取线程仍在扫描时等待其完成, 避免重复扫描
+            prefetch.join()
+            cls._prefetch_thread = None
+        return cls._scan(refresh=refresh)
+
+    @classmethod
+    def _scan(cls, *, refresh: bool = False) -> EntryPoints:
+        with cls._load_lock:
+            if refresh or cls.eps is None:
+                cls.eps = entry_points()
+                cls.clearEntryPointCache()
+            return cls.eps
+
+    @classmethod
+    def clearEntryPointCache(cls) -> None:
+        """清空按组/按名字缓存的查找结果, 下次查询时重新筛选."""
+        cls._group_cache.clear()
+        cls._single_cache.clear()
+
+    @classmethod
+    def prefetch(cls) -> None:
+        """在后台线程中预先扫描入口点.
+
+        扫描 site-packages 属于 I/O 密集操作, 启动时提前发起,
+        主线程可同时进行日志与配置的初始化; 之后的查询直接复用结果.
+        """
+        if cls.eps is not None or cls._prefetch_thread is not None:
+            return
+        thread = Thread(
+            target=cls._scan,
+            name="astrbot-entrypoints-prefetch",
+            daemon=True,
+        )
+        cls._prefetch_thread = thread
+        thread.start()
 
     @classmethod
     def getSingleEntryPoint(
@@ -19,16 +63,22 @@ class AstrbotCanaryHelper:
         refresh: bool = False,
     ) -> EntryPoint | None:
         """获取指定组-名字的单个入口点,找不到返回 None.."""
-        cls._ensure_loaded(refresh=refresh)
-        for ep in cls.eps.select(group=group, name=name):
-            return ep
-        return None
+        eps = cls._ensure_loaded(refresh=refresh)
+        key = (group, name)
+        if key in cls._single_cache:
+            return cls._single_cache[key]
+        found = next(iter(eps.select(group=group, name=name)), None)
+        cls._single_cache[key] = found
+        return found
 
     @classmethod
     def getAllEntryPoints(cls, group: str, *, refresh: bool = False) -> EntryPoints:
         """获取指定组的所有入口点(EntryPoints 对象).."""
-        cls._ensure_loaded(refresh=refresh)
-        return cls.eps.select(group=group)
+        eps = cls._ensure_loaded(refresh=refresh)
+        group_eps = cls._group_cache.get(group)
+        if group_eps is None:
+            group_eps = cls._group_cache[group] = eps.select(group=group)
+        return group_eps
 
     @classmethod
     def getMultiGroupAllEntryPoints(
@@ -42,7 +92,7 @@ class AstrbotCanaryHelper:
         merged: list[EntryPoint] = []
         seen: set[tuple[str | None, str | None, str | None]] = set()
         for group in groups:
-            for ep in cls.eps.select(group=group):
+            for ep in cls.getAllEntryPoints(group):
                 key = (ep.group, ep.name, ep.value)
                 if key in seen:
                     continue
@@ -1,3 +1,6 @@
+import gzip
+import os
+import tempfile
 import zipfile
 from contextlib import suppress
 from logging import Logger, getLogger
@@ -8,11 +11,19 @@ from tqdm import tqdm
 
 logger: Logger = getLogger("astrbot.module.web.frontend")
 
+# 需要预压缩的文本类静态资源
+PRECOMPRESS_SUFFIXES: frozenset[str] = frozenset(
+    {".js", ".css", ".html", ".svg", ".json", ".map"},
+)
+
 
 class AstrbotCanaryFrontend:
     """直接使用Astrbot官方前端."""
 
     webroot: Path
+    version: str = "latest"
+    """前端版本, 与 dist/index.html 的 mtime/大小一起写入就绪标记文件."""
+    ready_marker: str = ".astrbot_frontend_ready"
     dashboard_release_url: str = (
         "https://github.com/AstrBotDevs/AstrBot/releases/{version}/download/dist.zip"
     )
@@ -21,9 +32,15 @@ class AstrbotCanaryFrontend:
     def ensure(cls, webroot: Path) -> bool:
         """确保前端文件存在."""
         cls.webroot = webroot
+        if cls.is_ready(webroot):
+            # 仅为旧于源文件的资源重新压缩, 开销只有一次目录遍历
+            cls.precompress(webroot / "dist")
+            return True
         if cls.check(webroot):
+            cls.precompress(webroot / "dist")
+            cls.mark_ready(webroot)
             return True
-        dist_zip_path: Path = cls.download(webroot)
+        dist_zip_path: Path = cls.download(webroot, cls.version)
         logger.info("Frontend files downloaded to %s", dist_zip_path)
         # extract downloaded zip into webroot/dist
         try:
@@ -37,6 +54,8 @@ class AstrbotCanaryFrontend:
 
             with suppress(OSError, FileNotFoundError):
                 dist_zip_path.unlink(missing_ok=True)
+            cls.precompress(webroot / "dist")
+            cls.mark_ready(webroot)
             return True
         # 第二次检查仍然失败
         return False
@@ -47,6 +66,64 @@ class AstrbotCanaryFrontend:
         index_file = webroot / "dist" / "index.html"
         return index_file.exists() and index_file.is_file()
 
+    @classmethod
+    def fingerprint(cls, webroot: Path) -> str | None:
+        """前端文件指纹: 版本 + index.html 的 mtime 与大小, 文件不存在时返回 None.
+
+        替换或重新解压 dist 都会改写 index.html, 使旧的就绪标记失效.
+        """
+        try:
+            st = (webroot / "dist" / "index.html").stat()
+        except OSError:
+            return None
+        return f"{cls.version}:{st.st_mtime_ns}:{st.st_size}"
+
+    @classmethod
+    def is_ready(cls, webroot: Path) -> bool:
+        """就绪标记与当前前端文件指纹一致时跳过检查/下载."""
+        try:
+            marker = (webroot / "dist" / cls.ready_marker).read_text(encoding="utf-8")
+        except OSError:
+            return False
+        return marker == cls.fingerprint(webroot)
+
+    @classmethod
+    def mark_ready(cls, webroot: Path) -> None:
+        """原子写入就绪标记."""
+        dist = webroot / "dist"
+        fingerprint = cls.fingerprint(webroot)
+        if fingerprint is None:
+            return
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=dist,
+                delete=False,
+            ) as tmp:
+                tmp.write(fingerprint)
+            os.replace(tmp.name, dist / cls.ready_marker)  # noqa: PTH105
+        except OSError:
+            logger.warning("Failed to write frontend ready marker in %s", dist)
+
+    @classmethod
+    def precompress(cls, dist: Path) -> None:
+        """为文本类静态资源生成 .gz 副本,压缩开销从请求时移到构建时.
+
+        已存在且不旧于源文件的 .gz 会被跳过.
+        """
+        for path in dist.rglob("*"):
+            if path.suffix not in PRECOMPRESS_SUFFIXES or not path.is_file():
+                continue
+            gz_path = path.with_suffix(path.suffix + ".gz")
+            with suppress(FileNotFoundError):
+                if gz_path.stat().st_mtime >= path.stat().st_mtime:
+                    continue
+            try:
+                gz_path.write_bytes(gzip.compress(path.read_bytes(), compresslevel=9))
+            except OSError:
+                logger.warning("Failed to precompress %s", path)
+
     @classmethod
     def need_update(cls, webroot: Path) -> bool:
         """检查是否需要更新前端文件."""
@@ -6,7 +6,6 @@ from logging import Logger, getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
-import uvicorn
 from astrbot_canary_api import (
     AstrbotModuleType,
     ContainerRegistry,
@@ -16,22 +15,17 @@ from astrbot_canary_api import (
     IAstrbotPaths,
     moduleimpl,
 )
-from dishka import make_async_container
-from dishka.integrations.fastapi import FastapiProvider, setup_dishka
-from fastapi import FastAPI
-from fastapi.responses import ORJSONResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi_radar import Radar
 from pydantic import BaseModel
-from taskiq import AsyncBroker
-
-from astrbot_canary_web.api import api_router
-from astrbot_canary_web.api.provider import WebAPIProvider
-from astrbot_canary_web.frontend import AstrbotCanaryFrontend
 
+# FastAPI / uvicorn 等重量级依赖在 Awake / Start 内按需导入,
+# 仅导入本模块(例如未启用 web 模块时)不会付出这部分开销.
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
     from importlib.metadata import PackageMetadata
+
+    from dishka import Container
+    from fastapi import FastAPI
+    from taskiq import AsyncBroker
 logger: Logger = getLogger("astrbot.module.web")
 
 
@@ -43,6 +37,12 @@ class AstrbotCanaryWebConfig(BaseModel):
     jwt_exp_days: int = 7
 
 
+# 配置项的固定部分, 只有 webroot / cfg_dir 依赖运行时路径
+CFG_WEB_GROUP = "basic"
+CFG_WEB_NAME = "common"
+CFG_WEB_DESCRIPTION = "Web UI 监听的主机地址"
+
+
 class AstrbotCanaryWeb(IAstrbotModule):
     Paths: type[IAstrbotPaths] | None = None
     ConfigEntry: type[IAstrbotConfigEntry[AstrbotCanaryWebConfig]] | None = None
@@ -53,6 +53,8 @@ class AstrbotCanaryWeb(IAstrbotModule):
     info: PackageMetadata | None = None
 
     cfg_web: IAstrbotConfigEntry[AstrbotCanaryWebConfig] | None = None
+    webroot_path: Path | None = None
+    dist_path: Path | None = None
 
     def __init__(
         self,
@@ -83,9 +85,27 @@ class AstrbotCanaryWeb(IAstrbotModule):
             "%s is awakening.",
             cls.name,
         )
+        from astrbot_canary_web.frontend import AstrbotCanaryFrontend
 
         # Get dependencies from sync container (proper way for sync context)
         core_container = ContainerRegistry.get_sync("core")
+        cfg_web = cls._setup_config(core_container)
+        cls._setup_web_container(core_container, cfg_web)
+
+        webroot = cls.webroot_path
+        if webroot is None or not AstrbotCanaryFrontend.ensure(webroot):
+            msg = "Failed to ensure frontend files in webroot."
+            raise FileNotFoundError(msg)
+        logger.info(
+            "Frontend files are ready in %s",
+            webroot,
+        )
+
+        cls.app = cls._create_app()
+
+    @classmethod
+    def _setup_config(cls, core_container: Container) -> AstrbotCanaryWebConfig:
+        """从核心容器获取依赖, 绑定 web 配置并确定 webroot."""
         paths_instance: IAstrbotPaths = core_container.get(IAstrbotPaths)
 
         cls.ConfigEntry = core_container.get(dependency_type=type(IAstrbotConfigEntry))
@@ -97,27 +117,37 @@ class AstrbotCanaryWeb(IAstrbotModule):
             cls.broker = None
 
         cls.cfg_web = cls.ConfigEntry.bind(
-            group="basic",
-            name="common",
-            default=AstrbotCanaryWebConfig(
+            group=CFG_WEB_GROUP,
+            name=CFG_WEB_NAME,
+            # 其余字段均为模型默认值, 无需再次校验
+            default=AstrbotCanaryWebConfig.model_construct(
                 webroot=str(paths_instance.root / "webroot"),
-                host="127.0.0.1",
-                port=6185,
-                log_level="info",
-                jwt_exp_days=7,
             ),
-            description="Web UI 监听的主机地址",
+            description=CFG_WEB_DESCRIPTION,
             cfg_dir=paths_instance.config,
         )
+        cfg_web = cls.cfg_web.value
 
+        webroot = cls.webroot_path = Path(cfg_web.webroot).absolute()
+        cls.dist_path = webroot / "dist"
         logger.info(
             "Web Config initialized: %s, %s:%s",
-            Path(cls.cfg_web.value.webroot).absolute(),
-            cls.cfg_web.value.host,
-            cls.cfg_web.value.port,
+            webroot,
+            cfg_web.host,
+            cfg_web.port,
         )
+        return cfg_web
+
+    @staticmethod
+    def _setup_web_container(
+        core_container: Container,
+        cfg_web: AstrbotCanaryWebConfig,
+    ) -> None:
+        """创建 web 组件独立的异步容器并注册."""
+        from dishka import make_async_container
+        from dishka.integrations.fastapi import FastapiProvider
 
-        # Create WebAPIProvider and build web component container
+        from astrbot_canary_web.api.provider import WebAPIProvider
 
         # Create and configure web API provider
         api_provider = WebAPIProvider()
@@ -129,19 +159,22 @@ class AstrbotCanaryWeb(IAstrbotModule):
         except Exception:
             logger.warning("Could not get log handler from core container")
 
-        api_provider.set_jwt_exp_days(cls.cfg_web.value.jwt_exp_days)
+        api_provider.set_jwt_exp_days(cfg_web.jwt_exp_days)
 
         # Create independent async container for web component
         web_container = make_async_container(api_provider, FastapiProvider())
         ContainerRegistry.register_async("web", web_container)
 
-        if not AstrbotCanaryFrontend.ensure(Path(cls.cfg_web.value.webroot).absolute()):
-            msg = "Failed to ensure frontend files in webroot."
-            raise FileNotFoundError(msg)
-        logger.info(
-            "Frontend files are ready in %s",
-            Path(cls.cfg_web.value.webroot).absolute(),
-        )
+    @classmethod
+    def _create_app(cls) -> FastAPI:
+        """初始化 FastAPI 应用, 挂载 API 路由与前端静态文件."""
+        from dishka.integrations.fastapi import setup_dishka
+        from fastapi import FastAPI
+        from fastapi.responses import ORJSONResponse
+        from fastapi_radar import Radar
+
+        from astrbot_canary_web.api import api_router
+        from astrbot_canary_web.static import AstrbotCanaryStaticFiles
 
         @asynccontextmanager
         async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
@@ -158,7 +191,7 @@ class AstrbotCanaryWeb(IAstrbotModule):
 
         # 初始化 FastAPI 应用并挂载子路由
 
-        cls.app = FastAPI(
+        app = FastAPI(
             title="AstrBot Canary Web",
             description="AstrBot Canary Web API",
             version="0.1.0",
@@ -168,37 +201,38 @@ class AstrbotCanaryWeb(IAstrbotModule):
 
         # Register dishka async container to FastAPI app
         async_container = ContainerRegistry.get_async("core")
-        setup_dishka(container=async_container, app=cls.app)
+        setup_dishka(container=async_container, app=app)
         # Note: Radar initialization requires a database engine
         # For now, skip Radar initialization if engine is not available
         try:
             from sqlalchemy import create_engine
             # Create in-memory SQLite engine for monitoring
             engine = create_engine("sqlite:///:memory:")
-            radar = Radar(app=cls.app, db_engine=engine)
+            radar = Radar(app=app, db_engine=engine)
             radar.create_tables()
             logger.info("Radar monitoring initialized.")
         except ImportError:
             logger.warning("SQLAlchemy not available, skipping Radar initialization")
 
         # 嵌套挂载子路由(先注册 API 路由,保证 API 优先匹配)
-        cls.app.include_router(api_router)
+        app.include_router(api_router)
 
-        cls.app.mount(
+        app.mount(
             path="/",
-            app=StaticFiles(
-                directory=Path(cls.cfg_web.value.webroot) / "dist",
+            app=AstrbotCanaryStaticFiles(
+                directory=cls.dist_path,
                 html=True,
             ),
             name="frontend",
         )
-
-        # broker already fetched from core provider above, no need to repeat
+        return app
 
     @classmethod
     @moduleimpl
     def Start(cls) -> None:
         # 使用 Uvicorn 启动 FastAPI 应用
+        import uvicorn
+
         logger.info(
             "访问监控面板:http://%s:%s/__radar/",
             cls.cfg_web.value.host if cls.cfg_web else "127.0.0.1",
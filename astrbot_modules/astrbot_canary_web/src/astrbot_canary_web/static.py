@@ -0,0 +1,98 @@
+"""前端静态文件服务: 优先返回预压缩的 .gz 副本."""
+
+from __future__ import annotations
+
+import os
+from mimetypes import guess_type
+from pathlib import PurePath
+from typing import TYPE_CHECKING
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse
+
+from astrbot_canary_web.frontend import PRECOMPRESS_SUFFIXES
+
+if TYPE_CHECKING:
+    from starlette.responses import Response
+    from starlette.types import Scope
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """按 Accept-Encoding 的 q 值判断客户端是否接受 gzip, ``gzip;q=0`` 视为拒绝.
+
+    未单独列出 gzip 时以通配符 ``*`` 的 q 值为准.
+    """
+    qvalues: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.lower()] = q
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qvalues:
+            return qvalues[coding] > 0
+    return False
+
+
+class AstrbotCanaryStaticFiles(StaticFiles):
+    """StaticFiles 不会自动使用 .gz 副本,这里在客户端支持 gzip 时返回预压缩文件.
+
+    .gz 副本由 AstrbotCanaryFrontend.precompress 生成.
+    """
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        if PurePath(full_path).suffix not in PRECOMPRESS_SUFFIXES:
+            return super().file_response(full_path, stat_result, scope, status_code)
+        request_headers = Headers(scope=scope)
+        if _accepts_gzip(request_headers.get("accept-encoding", "")):
+            response = self._gzip_response(
+                full_path, stat_result, request_headers, status_code,
+            )
+            if response is not None:
+                return response
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        # 同一资源可能以 gzip 或原文返回, 共享缓存需按 Accept-Encoding 区分
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    def _gzip_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        request_headers: Headers,
+        status_code: int,
+    ) -> Response | None:
+        """返回 .gz 副本; 副本不存在或旧于源文件时返回 None."""
+        gz_path = f"{os.fspath(full_path)}.gz"
+        try:
+            gz_stat = os.stat(gz_path)  # noqa: PTH116
+        except OSError:
+            return None
+        if gz_stat.st_mtime < stat_result.st_mtime:
+            return None
+        response = FileResponse(
+            gz_path,
+            status_code=status_code,
+            stat_result=gz_stat,
+            media_type=guess_type(os.fspath(full_path))[0],
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -10,11 +10,14 @@ updated: 2025-11.1
 
 from __future__ import annotations
 
+import sys
 from atexit import register
-from logging import INFO, basicConfig, getLogger
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from logging import INFO, StreamHandler, basicConfig, getLogger
+from os import getenv
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-import rich.traceback
 from astrbot_canary_api import (
     ASTRBOT_MODULES_HOOK_NAME,
     AstrbotModuleType,
@@ -28,21 +31,29 @@ from astrbot_canary_api.interface import (
     AstrbotModuleSpec,
 )
 from astrbot_canary_helper import AstrbotCanaryHelper
-from click import Choice, prompt
-from dishka import make_async_container
-from pluggy import PluginManager as ModuleManager  # 为了区分加载器的 PluginManager...
 from pydantic import BaseModel
-from rich.logging import RichHandler
 
-from astrbot_canary.core.log_handler import AsyncAstrbotLogHandler
+from astrbot_canary.core.boot_cache import (
+    load_boot_cache,
+    read_boot_cache,
+    save_boot_cache,
+)
+from astrbot_canary.core.hooks import AstrbotModuleManager
 from astrbot_canary.core.models import AstrbotRootConfig
-from astrbot_canary.core.tasks import AstrbotTasks
-from astrbot_canary.provider import AstrbotCoreProvider
 from astrbot_canary_config import AstrbotConfigEntry  # 具体实现
 from astrbot_canary_paths import AstrbotPaths  # 具体实现
 
+# taskiq / dishka / click 等依赖在 Awake 及模块选择时按需导入,
+# 以免拖慢仅导入本模块(如 --help)的场景.
 if TYPE_CHECKING:
-    from importlib.metadata import EntryPoints
+    from collections.abc import Callable, Iterable
+    from importlib.metadata import EntryPoint, EntryPoints
+    from logging import Handler
+    from pathlib import Path
+    from types import TracebackType
+
+    from astrbot_canary.core.log_handler import AsyncAstrbotLogHandler
+    from astrbot_canary.core.tasks import AstrbotLazyBroker
 
 
 
@@ -64,22 +75,47 @@ class AstrbotDatabaseConfig(BaseModel):
     """连接超时(用于 Redis、PostgreSQL 等)"""
 
 
-# 安装错误堆栈追踪器
-# enable rich tracebacks and pretty console logging
-_ = rich.traceback.install()
-# rich + logging
-basicConfig(
-    level=INFO,
-    format="%(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[RichHandler(rich_tracebacks=True, markup=True)],
-)
-
 logger = getLogger("astrbot")
 
+# log_what -> 挂载日志处理器的方式, 其余取值视为 logger 名称
+_LOG_DISPATCH: dict[str, Callable[[Handler], None]] = {
+    "astrbot": logger.addHandler,
+    "none": lambda _handler: None,
+}
+
+# 按类型划分的入口点组(如 astrbot.modules.tui), 组名即声明了模块类型
+_TYPED_MODULE_GROUPS: dict[str, AstrbotModuleType] = {
+    f"{ASTRBOT_MODULES_HOOK_NAME}.{suffix}": module_type
+    for suffix, module_type in (
+        ("core", AstrbotModuleType.CORE),
+        ("loader", AstrbotModuleType.LOADER),
+        ("web", AstrbotModuleType.WEB),
+        ("tui", AstrbotModuleType.TUI),
+    )
+}
+_MODULE_GROUPS: list[str] = [ASTRBOT_MODULES_HOOK_NAME, *_TYPED_MODULE_GROUPS]
+
+
+def _lazy_rich_hook(
+    exc_type: type[BaseException],
+    exc_value: BaseException,
+    traceback: TracebackType | None,
+) -> None:
+    """首次出现未捕获异常时才导入 rich 并安装错误堆栈追踪器."""
+    import rich.traceback
+
+    # 安装错误堆栈追踪器
+    rich.traceback.install()
+    # install() 未能替换钩子时回退到默认钩子, 避免递归调用自身
+    hook = sys.excepthook
+    if hook is _lazy_rich_hook:
+        hook = sys.__excepthook__
+    hook(exc_type, exc_value, traceback)
+
+
 # @AstrbotInjector.inject
 class AstrbotRootModule(IAstrbotModule):
-    mm: ModuleManager = ModuleManager(ASTRBOT_MODULES_HOOK_NAME)
+    mm: AstrbotModuleManager = AstrbotModuleManager(ASTRBOT_MODULES_HOOK_NAME)
     pypi_name: str = "astrbot_canary"
     name: str = "canary_root"
     module_type: AstrbotModuleType = AstrbotModuleType.CORE
@@ -90,10 +126,18 @@ class AstrbotRootModule(IAstrbotModule):
 
     # Dynamically set in Awake
     paths: IAstrbotPaths
-    broker: AsyncBroker
+    broker: AstrbotLazyBroker
 
     cfg_root: IAstrbotConfigEntry[AstrbotRootConfig]
 
+    # 启动模块的入口点, 在首次调用模块钩子前才导入并注册
+    _boot_eps: ClassVar[list[EntryPoint]] = []
+    _boot_lock: ClassVar[Lock] = Lock()
+    _booted: ClassVar[bool] = False
+    _destroy_impls: ClassVar[list[Callable[[], object]]] = []
+    # _setup_console 安装了 StreamHandler, 尚待替换为 RichHandler
+    _rich_pending: ClassVar[bool] = False
+
     """Astrbot根模块
     请勿参考本模块进行开发
     本模块为入口模块.
@@ -102,14 +146,27 @@ class AstrbotRootModule(IAstrbotModule):
     @classmethod
     def Awake(cls) -> None:
         """AstrbotCanary 主入口函数,负责加载模块并调用其生命周期方法."""
+        from dishka import make_async_container, make_container
+
+        from astrbot_canary.core.log_handler import AsyncAstrbotLogHandler
+        from astrbot_canary.core.tasks import AstrbotLazyBroker
+        from astrbot_canary.provider import AstrbotCoreProvider
+
+        cls._setup_console()
         logger.info("AstrbotCanary 正在启动,加载模块...")
         cls.mm.add_hookspecs(AstrbotModuleSpec)
         cls.paths = cls.Paths.getPaths(cls.pypi_name)
+        # 启动缓存只读取一次, 解析 boot 配置时复用;
+        # 缓存失效时才需要扫描入口点, 与下面的配置/容器初始化并行进行
+        boot_cache = read_boot_cache(cls._boot_cache_file(), ASTRBOT_MODULES_HOOK_NAME)
+        if boot_cache is None:
+            AstrbotCanaryHelper.prefetch()
 
         cls.cfg_root = cls.ConfigEntry.bind(
             group="core",
             name="boot",
-            default=AstrbotRootConfig(
+            # 默认值均为已知合法值, 跳过校验直接构造
+            default=AstrbotRootConfig.model_construct(
                 modules=["canary_core", "canary_loader", "canary_web", "canary_tui"],
                 boot=["canary_core", "canary_loader", "canary_web"],
                 log_what="astrbot",
@@ -135,13 +192,11 @@ class AstrbotRootModule(IAstrbotModule):
             cfg_dir=cls.paths.config,
         )
 
-        # 将 cfg_root 作为 tasks 配置传递
-        AstrbotTasks.init(cls.cfg_root)
-
-        cls.broker = AstrbotTasks.broker
+        # 将 cfg_root 作为 tasks 配置传递, 首次使用 broker 时才初始化
+        cls.broker = AstrbotLazyBroker(cls.cfg_root)
 
         handler = AsyncAstrbotLogHandler(maxsize=cls.cfg_root.value.log_maxsize)
-        cls._setup_logging(handler, cls.cfg_root.value.log_what)
+        cls._setup_logging(handler, sys.intern(cls.cfg_root.value.log_what))
 
         # 创建 dishka core provider 并构建容器
 
@@ -157,7 +212,6 @@ class AstrbotRootModule(IAstrbotModule):
         # Create both sync and async containers for core component
         # - Sync container: for sync module lifecycle methods (Awake, Start, etc.)
         # - Async container: for FastAPI async routes with @inject decorator
-        from dishka import make_container
         sync_container = make_container(_core_provider)
         async_container = make_async_container(_core_provider)
 
@@ -165,153 +219,268 @@ class AstrbotRootModule(IAstrbotModule):
         ContainerRegistry.register_sync("core", sync_container)
         ContainerRegistry.register_async("core", async_container)
 
-        boot: list[type[IAstrbotModule]] = []
         # 自动选择默认值 True, 避免阻塞
-        boot = cls._boot_from_config(cls.cfg_root.value.boot)
+        # 驻留配置中读出的名字, 之后作为字典键查找时可直接按身份命中
+        boot_names = [sys.intern(name) for name in cls.cfg_root.value.boot]
+        cls._boot_eps = cls._boot_from_config(boot_names, boot_cache)
+        cls.cfg_root.value.boot = [ep.name for ep in cls._boot_eps]
 
-        for astrbot_module in boot:
-            cls.mm.register(astrbot_module)
+        # 已确定启动, 切换到 rich 控制台输出
+        cls._upgrade_to_rich_handler()
 
-        _boot = [i.name for i in boot]
-        cls.cfg_root.value.boot = _boot
+        # 调试用: 跳过延迟加载, 立即导入全部启动模块
+        if getenv("ASTRBOT_EAGER_LOAD") == "1":
+            cls._load_boot_modules()
 
         # region Start
 
+    @classmethod
+    def _load_boot_modules(cls) -> None:
+        """导入并注册启动模块, 仅执行一次."""
+        with cls._boot_lock:
+            if cls._booted:
+                return
+            loaded, failed = cls._load_entry_points(cls._boot_eps)
+            for ep, error in failed:
+                logger.error("模块 %s 加载失败: %s", ep.name, error)
+            for module in loaded:
+                # ep.load() should return a class (module implementation). 进行安全检查:
+                # 同一模块被多个入口点引用时只注册一次
+                if not isinstance(module, type) or cls.mm.is_registered(module):
+                    continue
+                cls.mm.register(module)
+            # 按 pluggy 的调用顺序记录 OnDestroy 实现, 供退出时直接调用
+            cls._destroy_impls = [
+                impl.function
+                for impl in reversed(cls.mm.hook.OnDestroy.get_hookimpls())
+            ]
+            cls._booted = True
+
     @classmethod
     def Start(cls) -> None:
-        cls.mm.hook.Awake()
-        cls.mm.hook.Start()
+        cls._load_boot_modules()
+        cls.mm.call("Awake")
+        cls.mm.call("Start")
 
     @classmethod
     def OnDestroy(cls) -> None:
-        cls.mm.hook.OnDestroy()
+        cls.mm.call("OnDestroy")
 
         cls.cfg_root.save()
 
+    @classmethod
+    def _setup_console(cls) -> None:
+        """配置控制台日志与错误堆栈追踪.
+
+        仅在启动时调用, 作为库导入本模块时不会触碰全局日志配置;
+        根 logger 已配置过处理器时跳过.
+        先使用标准库 StreamHandler, rich 只在确定启动后
+        (见 _upgrade_to_rich_handler) 或首次出现未捕获异常时才导入.
+        """
+        if getLogger().handlers:
+            return
+        basicConfig(
+            level=INFO,
+            format="%(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            handlers=[StreamHandler()],
+        )
+        cls._rich_pending = True
+        sys.excepthook = _lazy_rich_hook
+
+    @classmethod
+    def _upgrade_to_rich_handler(cls) -> None:
+        """将 _setup_console 安装的 StreamHandler 替换为 RichHandler."""
+        if not cls._rich_pending:
+            return
+        cls._rich_pending = False
+        from rich.logging import RichHandler
+
+        # enable rich tracebacks and pretty console logging
+        root = getLogger()
+        for handler in root.handlers[:]:
+            if type(handler) is StreamHandler:
+                root.removeHandler(handler)
+        root.addHandler(RichHandler(rich_tracebacks=True, markup=True))
+
     @classmethod
     def _setup_logging(cls, handler: AsyncAstrbotLogHandler, log_what: str) -> None:
-        match log_what:
-            case "astrbot":
-                logger.addHandler(handler)
-            case "none":
-                del handler
-            case _:
-                _logger = getLogger(log_what)
-                _logger.addHandler(handler)
+        attach = _LOG_DISPATCH.get(log_what)
+        if attach is None:
+            attach = getLogger(log_what).addHandler
+        attach(handler)
+
+    @classmethod
+    def _boot_cache_file(cls) -> Path:
+        """启动模块解析缓存文件."""
+        return cls.paths.data / "boot_resolve.json"
 
     @classmethod
-    def _boot_from_config(cls, boot_names: list[str]) -> list[type[IAstrbotModule]]:
-        boot: list[type[IAstrbotModule]] = []
-        for i in boot_names:
-            ep = AstrbotCanaryHelper.getSingleEntryPoint(
-                ASTRBOT_MODULES_HOOK_NAME,
-                i,
-            )
-            if ep is None:
-                continue
-            module = ep.load()
-            # ep.load() should return a class (module implementation). 进行安全检查:
-            if module is None:
-                continue
-            if isinstance(module, type):
-                boot.append(module)
+    def _boot_from_config(
+        cls,
+        boot_names: list[str],
+        boot_cache: dict[str, Any] | None,
+    ) -> list[EntryPoint]:
+        """按配置查找启动模块的入口点, 此处不导入模块.
+
+        解析结果缓存在模块数据目录中, 环境未变化时跳过入口点扫描.
+        """
+        cache_file = cls._boot_cache_file()
+        cached = load_boot_cache(boot_cache, boot_names)
+        if cached is not None:
+            return cached
+        # 只查询一次入口点组, 之后按名字索引
+        module_eps = {
+            ep.name: ep
+            for ep in AstrbotCanaryHelper.getMultiGroupAllEntryPoints(_MODULE_GROUPS)
+        }
+        boot = [module_eps[i] for i in boot_names if i in module_eps]
+        save_boot_cache(cache_file, ASTRBOT_MODULES_HOOK_NAME, boot_names, boot)
         return boot
 
     @classmethod
-    def _boot_from_entrypoints(cls) -> list[type[IAstrbotModule]]:
-        boot: list[type[IAstrbotModule] | None] = []
-        module_eps: EntryPoints = AstrbotCanaryHelper.getAllEntryPoints(
-            group=ASTRBOT_MODULES_HOOK_NAME,
+    def _boot_from_entrypoints(cls) -> list[EntryPoint]:
+        """按模块类型各选出一个启动模块的入口点, 此处不导入选中的模块."""
+        module_eps: EntryPoints = AstrbotCanaryHelper.getMultiGroupAllEntryPoints(
+            _MODULE_GROUPS,
         )
-        _, core_module, loader_module, web_module, tui_module = cls.group_modules(
+        # 先按入口点声明的类型分组, 只导入最终选中的模块
+        _, core_eps, loader_eps, web_eps, tui_eps = cls.group_entry_points(
             module_eps,
         )
         logger.debug(
             "core:%s\nloader:%s\nweb:%s\ntui:%s",
-            core_module,
-            loader_module,
-            web_module,
-            tui_module,
+            core_eps,
+            loader_eps,
+            web_eps,
+            tui_eps,
         )
 
         # 发现未知模块
         if _:
             logger.warning("发现未知模块%s", _)
 
-        boot.append(cls._select_single_module(core_module, "请选择一个核心模块加载"))
-        boot.append(cls._select_single_module(loader_module, "请选择一个加载器模块"))
-        ui_candidates = web_module + tui_module
-        boot.append(
-            cls._select_single_module(ui_candidates, "请选择一个UI模块 (web/tui)"),
-        )
+        selected = [
+            cls._select_single_module(core_eps, "请选择一个核心模块加载"),
+            cls._select_single_module(loader_eps, "请选择一个加载器模块"),
+            cls._select_single_module(web_eps + tui_eps, "请选择一个UI模块 (web/tui)"),
+        ]
         # 过滤掉None
-        return [m for m in boot if m is not None]
+        return [ep for ep in selected if ep is not None]
 
     @classmethod
     def _select_single_module(
         cls,
-        modules: list[type[IAstrbotModule]],
+        eps: list[EntryPoint],
         prompt_msg: str,
-    ) -> type[IAstrbotModule] | None:
-        if not modules:
+    ) -> EntryPoint | None:
+        if not eps:
             return None
-        if len(modules) == 1:
-            return modules[0]
-        names = [
-            getattr(m, "pypi_name", getattr(m, "__name__", repr(m))) for m in modules
-        ]
-        sel: str = prompt(prompt_msg, type=Choice(names))
-        for m in modules:
-            if (
-                getattr(m, "pypi_name", None) == sel
-                or getattr(m, "__name__", None) == sel
-            ):
-                return m
-        return None
+        if len(eps) == 1:
+            return eps[0]
+        from click import Choice, prompt
+
+        name_map = {ep.name: ep for ep in eps}
+        sel: str = prompt(prompt_msg, type=Choice(list(name_map)))
+        return name_map.get(sel)
+
+    @staticmethod
+    def _declared_module_type(ep: EntryPoint) -> AstrbotModuleType | None:
+        """由入口点组名(如 ``astrbot.modules.web``)得到模块类型, 未声明返回 None."""
+        return _TYPED_MODULE_GROUPS.get(ep.group)
 
     @classmethod
-    def group_modules(
+    def group_entry_points(
         cls,
         eps: EntryPoints,
     ) -> tuple[
-        list[type[IAstrbotModule]],
-        list[type[IAstrbotModule]],
-        list[type[IAstrbotModule]],
-        list[type[IAstrbotModule]],
-        list[type[IAstrbotModule]],
+        list[EntryPoint],
+        list[EntryPoint],
+        list[EntryPoint],
+        list[EntryPoint],
+        list[EntryPoint],
     ]:
-        """分组模块."""
-        unknown_module: list[type[IAstrbotModule]] = []
-        core_module: list[type[IAstrbotModule]] = []
-        loader_module: list[type[IAstrbotModule]] = []
-        web_module: list[type[IAstrbotModule]] = []
-        tui_module: list[type[IAstrbotModule]] = []
+        """按模块类型分组入口点.
+
+        类型优先取自入口点组名, 无需导入模块;
+        位于通用组 astrbot.modules 的入口点才回退到 ep.load() 读取 module_type.
+        """
+        unknown_eps: list[EntryPoint] = []
+        buckets: dict[AstrbotModuleType, list[EntryPoint]] = {
+            AstrbotModuleType.CORE: [],
+            AstrbotModuleType.LOADER: [],
+            AstrbotModuleType.WEB: [],
+            AstrbotModuleType.TUI: [],
+        }
 
         for ep in eps:
-            module: type[IAstrbotModule] = ep.load()
-            # ep.load() can return different things depending on the entrypoint.
-            # We expect a class that implements IAstrbotModule (subclass or registered).
-
-            match module.module_type:
-                case AstrbotModuleType.CORE:
-                    core_module.append(module)
-                case AstrbotModuleType.LOADER:
-                    loader_module.append(module)
-                case AstrbotModuleType.WEB:
-                    web_module.append(module)
-                case AstrbotModuleType.TUI:
-                    tui_module.append(module)
-                case _:
-                    unknown_module.append(module)
-
-        return unknown_module, core_module, loader_module, web_module, tui_module
+            module_type = cls._declared_module_type(ep)
+            if module_type is None:
+                module = ep.load()
+                if not isinstance(module, type):
+                    unknown_eps.append(ep)
+                    continue
+                # 未声明 module_type 的模块归入未知模块
+                module_type = getattr(module, "module_type", AstrbotModuleType.UNKNOWN)
+            buckets.get(module_type, unknown_eps).append(ep)
+
+        return (
+            unknown_eps,
+            buckets[AstrbotModuleType.CORE],
+            buckets[AstrbotModuleType.LOADER],
+            buckets[AstrbotModuleType.WEB],
+            buckets[AstrbotModuleType.TUI],
+        )
+
+    @staticmethod
+    def _load_entry_points(
+        eps: Iterable[EntryPoint],
+    ) -> tuple[list[type[IAstrbotModule]], list[tuple[EntryPoint, Exception]]]:
+        """并行导入入口点, 单个模块导入失败不影响其余模块.
+
+        返回按入口点顺序排列的导入结果, 以及导入失败的入口点与异常.
+        多线程同时导入相互依赖的模块时可能触发导入锁死锁等并发错误,
+        因此线程池中失败的入口点会在当前线程串行重试, 仍失败才视为加载失败.
+        """
+        def load(ep: EntryPoint) -> type[IAstrbotModule] | Exception:
+            try:
+                return cast("type[IAstrbotModule]", ep.load())
+            except Exception as e:  # noqa: BLE001
+                return e
+
+        ep_list = list(eps)
+        if not ep_list:
+            return [], []
+        with ThreadPoolExecutor(max_workers=min(8, len(ep_list))) as executor:
+            results = list(executor.map(load, ep_list))
+        results = [
+            load(ep) if isinstance(result, Exception) else result
+            for ep, result in zip(ep_list, results, strict=True)
+        ]
+
+        loaded: list[type[IAstrbotModule]] = []
+        failed: list[tuple[EntryPoint, Exception]] = []
+        for ep, result in zip(ep_list, results, strict=True):
+            if isinstance(result, Exception):
+                failed.append((ep, result))
+            else:
+                loaded.append(result)
+        return loaded, failed
 
     # region Destroy
     @staticmethod
     @register
     def atExit() -> None:
         logger.info("AstrbotCanary 正在退出,执行清理操作...")
-        AstrbotRootModule.OnDestroy()
+        # 解释器退出阶段直接调用启动时记录的实现, 不再经过 pluggy
+        for on_destroy in AstrbotRootModule._destroy_impls:
+            try:
+                on_destroy()
+            except Exception:
+                logger.exception("模块 OnDestroy 执行失败")
+        cfg_root = getattr(AstrbotRootModule, "cfg_root", None)
+        if cfg_root is not None:
+            cfg_root.save()
 
     # region Destroy
 
@@ -0,0 +1,89 @@
+"""启动模块解析缓存.
+
+记录 boot 配置解析出的入口点, 下次启动时若 boot 配置与 sys.path
+各目录的修改时间(安装/卸载包会改变)均未变化, 直接还原入口点,
+跳过整个 entry_points 扫描.
+"""
+
+from __future__ import annotations
+
+import sys
+from contextlib import suppress
+from importlib.metadata import EntryPoint
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+__all__ = ["load_boot_cache", "read_boot_cache", "save_boot_cache"]
+
+logger = getLogger("astrbot.core.boot_cache")
+
+
+def _fingerprint() -> list[list[str | int]]:
+    """sys.path 中各路径及其修改时间.
+
+    跳过代表当前工作目录的空字符串, 否则从不同目录启动时缓存总会失效.
+    """
+    fingerprint: list[list[str | int]] = []
+    for entry in sys.path:
+        if not entry:
+            continue
+        with suppress(OSError):
+            fingerprint.append([entry, Path(entry).stat().st_mtime_ns])
+    return fingerprint
+
+
+def read_boot_cache(cache_file: Path, group: str) -> dict[str, Any] | None:
+    """读取缓存, 缺失/损坏或环境已变化时返回 None.
+
+    返回值不为 None 即说明缓存对当前环境仍有效(不检查 boot 配置),
+    可用于决定是否需要预扫描入口点, 再传给 load_boot_cache 还原入口点.
+    """
+    try:
+        data = orjson.loads(cache_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("group") != group
+        or data.get("fingerprint") != _fingerprint()
+    ):
+        return None
+    return data
+
+
+def load_boot_cache(
+    cache: dict[str, Any] | None,
+    boot_names: list[str],
+) -> list[EntryPoint] | None:
+    """由 read_boot_cache 的结果还原入口点, 缓存缺失或 boot 配置变化时返回 None."""
+    if cache is None or cache.get("boot") != boot_names:
+        return None
+    try:
+        return [
+            EntryPoint(name=name, value=value, group=ep_group)
+            for name, value, ep_group in cache["entry_points"]
+        ]
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def save_boot_cache(
+    cache_file: Path,
+    group: str,
+    boot_names: list[str],
+    eps: list[EntryPoint],
+) -> None:
+    """写入入口点解析结果, 每个入口点保留各自所在的组."""
+    data = {
+        "group": group,
+        "boot": boot_names,
+        "fingerprint": _fingerprint(),
+        "entry_points": [[ep.name, ep.value, ep.group] for ep in eps],
+    }
+    try:
+        cache_file.write_bytes(orjson.dumps(data))
+    except OSError:
+        logger.warning("无法写入启动缓存 %s", cache_file)
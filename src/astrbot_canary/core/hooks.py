@@ -0,0 +1,78 @@
+"""模块钩子调度: 在 pluggy 之上缓存编译后的调用栈."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pluggy import PluginManager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+
+class AstrbotModuleManager(PluginManager):
+    """Astrbot 模块管理器.
+
+    Awake/Start/OnDestroy 均为无参数钩子, 注册的模块也很少,
+    pluggy 每次调用的参数组装与 _multicall 开销占了大头.
+    这里把每个钩子的实现展开成普通函数列表并缓存,
+    注册/注销模块时通过版本号使缓存失效.
+    启用调用监控(add_hookcall_monitoring / enable_tracing)期间,
+    call 直接交回 pluggy, 以便监控回调照常触发.
+    """
+
+    def __init__(self, project_name: str) -> None:
+        super().__init__(project_name)
+        self._version: int = 0
+        self._compiled: dict[str, tuple[int, Callable[[], list[Any]]]] = {}
+        # 未启用监控时的调用实现, 监控会替换 _inner_hookexec
+        self._plain_hookexec = self._inner_hookexec
+
+    def register(self, plugin: object, name: str | None = None) -> str | None:
+        plugin_name = super().register(plugin, name)
+        self._version += 1
+        return plugin_name
+
+    def unregister(
+        self,
+        plugin: object | None = None,
+        name: str | None = None,
+    ) -> Any | None:  # noqa: ANN401
+        unregistered = super().unregister(plugin, name)
+        self._version += 1
+        return unregistered
+
+    def add_hookspecs(self, module_or_class: ModuleType | type) -> None:
+        super().add_hookspecs(module_or_class)
+        self._version += 1
+
+    def call(self, hook_name: str) -> list[Any]:
+        """调用无参数钩子, 返回非 None 的结果列表(与 pluggy 一致)."""
+        if self._inner_hookexec is not self._plain_hookexec:
+            return getattr(self.hook, hook_name)()  # type: ignore[no-any-return]
+        compiled = self._compiled.get(hook_name)
+        if compiled is None or compiled[0] != self._version:
+            compiled = (self._version, self._compile(hook_name))
+            self._compiled[hook_name] = compiled
+        return compiled[1]()
+
+    def _compile(self, hook_name: str) -> Callable[[], list[Any]]:
+        caller = getattr(self.hook, hook_name)
+        impls = caller.get_hookimpls()
+        firstresult = caller.spec is not None and caller.spec.opts.get("firstresult")
+        # 存在包装器或 firstresult 时语义较复杂, 交回 pluggy 处理
+        if firstresult or any(impl.wrapper or impl.hookwrapper for impl in impls):
+            return caller  # type: ignore[no-any-return]
+        # pluggy 按注册顺序倒序调用 (tryfirst 排在列表末尾)
+        functions = tuple(impl.function for impl in reversed(impls))
+
+        def call_stack() -> list[Any]:
+            results: list[Any] = []
+            for function in functions:
+                result = function()
+                if result is not None:
+                    results.append(result)
+            return results
+
+        return call_stack
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-from taskiq import AsyncBroker, InMemoryBroker
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar
 
+# taskiq 在 AstrbotTasks.init 中才导入, 从不投递任务时无需加载
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from astrbot_canary_api import IAstrbotConfigEntry
+    from taskiq import AsyncBroker
 
     from astrbot_canary.core.models import AstrbotTasksConfig
 
@@ -16,46 +19,31 @@ class AstrbotTasks:
     提供全局任务队列和结果后端.
     """
 
-    broker: AsyncBroker = InMemoryBroker()
+    broker: ClassVar[AsyncBroker]
+    """全局 broker, 由 init 创建."""
 
     @classmethod
-    def init(cls, cfg_tasks: IAstrbotConfigEntry[Any]) -> None:
-        """初始化任务系统, 接受任何包含 broker_type 和 backend_type 属性的配置."""
-        broker_map = {
-            "inmemory": cls.init_inmemory_broker,
-            "zeromq": cls.init_zeromq_broker,
-            "redis": cls.init_redis_broker,
-            "rabbitmq": cls.init_rabbitmq_broker,
-            "nats": cls.init_nats_broker,
-            "postgresql": cls.init_postgresql_broker,
-            "sqs": cls.init_sqs_broker,
-            "ydb": cls.init_ydb_broker,
-            "custom": cls.init_custom_broker,
-        }
-        backend_map = {
-            "inmemory": cls.init_inmemory_backend,
-            "dummy": cls.init_dummy_backend,
-            "redis": cls.init_redis_backend,
-            "nats": cls.init_nats_backend,
-            "postgresql": cls.init_postgresql_backend,
-            "s3": cls.init_s3_backend,
-            "ydb": cls.init_ydb_backend,
-        }
-
+    def validate(cls, cfg_tasks: IAstrbotConfigEntry[Any]) -> None:
+        """检查 broker_type 与 backend_type 是否受支持, 不导入 taskiq."""
         broker_type = cfg_tasks.value.broker_type
-        backend_type = cfg_tasks.value.backend_type
-
-        broker_func = broker_map.get(broker_type)
-        if broker_func is None:
+        if broker_type not in _BROKER_INITS:
             msg = f"不支持的任务队列类型:{broker_type}"
             raise ValueError(msg)
-        broker_func(cfg_tasks.value)
-
-        backend_func = backend_map.get(backend_type)
-        if backend_func is None:
+        backend_type = cfg_tasks.value.backend_type
+        if backend_type not in _BACKEND_INITS:
             msg = f"不支持的结果后端类型:{backend_type}"
             raise ValueError(msg)
-        backend_func(cfg_tasks.value)
+
+    @classmethod
+    def init(cls, cfg_tasks: IAstrbotConfigEntry[Any]) -> None:
+        """初始化任务系统, 接受任何包含 broker_type 和 backend_type 属性的配置."""
+        from taskiq import AsyncBroker, InMemoryBroker
+
+        cls.validate(cfg_tasks)
+        # 默认使用 InMemoryBroker, 其余类型由各自的初始化函数替换
+        cls.broker = InMemoryBroker()
+        _BROKER_INITS[cfg_tasks.value.broker_type](cfg_tasks.value)
+        _BACKEND_INITS[cfg_tasks.value.backend_type](cfg_tasks.value)
 
         @cls.broker.task(
             "astrbot://echo",
@@ -151,3 +139,49 @@ class AstrbotTasks:
     def init_ydb_backend(cls, cfg: AstrbotTasksConfig) -> None:
         msg = "YDB 结果后端暂未实现"
         raise NotImplementedError(msg)
+
+
+# 类型 -> 初始化函数, 模块加载时构建一次
+_BROKER_INITS: dict[str, Callable[[AstrbotTasksConfig], None]] = {
+    "inmemory": AstrbotTasks.init_inmemory_broker,
+    "zeromq": AstrbotTasks.init_zeromq_broker,
+    "redis": AstrbotTasks.init_redis_broker,
+    "rabbitmq": AstrbotTasks.init_rabbitmq_broker,
+    "nats": AstrbotTasks.init_nats_broker,
+    "postgresql": AstrbotTasks.init_postgresql_broker,
+    "sqs": AstrbotTasks.init_sqs_broker,
+    "ydb": AstrbotTasks.init_ydb_broker,
+    "custom": AstrbotTasks.init_custom_broker,
+}
+_BACKEND_INITS: dict[str, Callable[[AstrbotTasksConfig], None]] = {
+    "inmemory": AstrbotTasks.init_inmemory_backend,
+    "dummy": AstrbotTasks.init_dummy_backend,
+    "redis": AstrbotTasks.init_redis_backend,
+    "nats": AstrbotTasks.init_nats_backend,
+    "postgresql": AstrbotTasks.init_postgresql_backend,
+    "s3": AstrbotTasks.init_s3_backend,
+    "ydb": AstrbotTasks.init_ydb_backend,
+}
+
+
+class AstrbotLazyBroker:
+    """延迟初始化的 broker: 首次调用 get 时才初始化任务系统.
+
+    纯 TUI 等从不投递任务的场景无需付出 taskiq 导入与 broker / backend 的初始化开销.
+    配置在构造时即校验, 不支持的类型仍在启动阶段报错.
+    """
+
+    def __init__(self, cfg_tasks: IAstrbotConfigEntry[Any]) -> None:
+        AstrbotTasks.validate(cfg_tasks)
+        self._cfg_tasks = cfg_tasks
+        self._broker: AsyncBroker | None = None
+        self._lock = Lock()
+
+    def get(self) -> AsyncBroker:
+        """返回 broker, 首次调用时初始化任务系统."""
+        if self._broker is None:
+            with self._lock:
+                if self._broker is None:
+                    AstrbotTasks.init(self._cfg_tasks)
+                    self._broker = AstrbotTasks.broker
+        return self._broker
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from astrbot_canary_api import (
     IAstrbotConfigEntry,
@@ -14,6 +14,9 @@ from taskiq import (
     AsyncBroker,  # 这个不能放到TYPE_CHECKING里,否则dishka无法识别类型
 )
 
+if TYPE_CHECKING:
+    from astrbot_canary.core.tasks import AstrbotLazyBroker
+
 
 class AstrbotCoreProvider(Provider):
     """Dishka Provider for core AstrBot services."""
@@ -23,7 +26,7 @@ class AstrbotCoreProvider(Provider):
     def __init__(
         self,
         jwt_exp_days: int = 7,
-        broker: AsyncBroker | None = None,
+        broker: AstrbotLazyBroker | None = None,
         log_handler: IAstrbotLogHandler | None = None,
         paths: IAstrbotPaths | None = None,
         config_entry: type[IAstrbotConfigEntry[Any]] | None = None,
@@ -42,8 +45,8 @@ class AstrbotCoreProvider(Provider):
 
     @provide(scope=Scope.APP)
     def get_broker(self) -> AsyncBroker | None:
-        """Provide AsyncBroker instance."""
-        return self._broker
+        """Provide AsyncBroker instance, initializing the task system on first use."""
+        return self._broker.get() if self._broker is not None else None
 
     @provide(scope=Scope.APP, provides=IAstrbotLogHandler)
     def get_log_handler(self) -> IAstrbotLogHandler:
@@ -1,3 +1,4 @@
+import os
 import warnings
 from enum import Enum
 from pathlib import Path
@@ -285,3 +286,211 @@ def test_bind_file_exists(tmp_path: Path) -> None:
         entry.value.type_2 == Type2.OPTION_X
         or entry.value.type_2 == Type2.OPTION_X.value
     )
+
+
+def test_save_skips_unchanged(tmp_cfg_dir: Path) -> None:
+    entry = AstrbotConfigEntry[SubConfig].bind(
+        group="g",
+        name="unchanged",
+        default=SubConfig(),
+        description="d",
+        cfg_dir=tmp_cfg_dir,
+    )
+    assert entry.cfg_file is not None
+    entry.cfg_file.write_text("# 外部修改\n", encoding="utf-8")
+    # 值未变化, 不应覆盖文件
+    entry.save()
+    assert entry.cfg_file.read_text(encoding="utf-8") == "# 外部修改\n"
+    entry.value.sub_field2 = 7
+    entry.save()
+    assert "sub_field2 = 7" in entry.cfg_file.read_text(encoding="utf-8")
+
+
+def test_bind_reuses_parsed_file(tmp_cfg_dir: Path) -> None:
+    first = AstrbotConfigEntry[SubConfig].bind(
+        group="g",
+        name="cached",
+        default=SubConfig(),
+        description="d",
+        cfg_dir=tmp_cfg_dir,
+    )
+    first.value.sub_field2 = 9
+    first.save()
+    second = AstrbotConfigEntry[SubConfig].bind(
+        group="g",
+        name="cached",
+        default=SubConfig(),
+        description="d",
+        cfg_dir=tmp_cfg_dir,
+    )
+    third = AstrbotConfigEntry[SubConfig].bind(
+        group="g",
+        name="cached",
+        default=SubConfig(),
+        description="d",
+        cfg_dir=tmp_cfg_dir,
+    )
+    assert second.value.sub_field2 == third.value.sub_field2 == 9
+    # 各次绑定得到独立的值对象
+    assert second.value is not third.value
+
+
+def test_save_rewrites_changed_schema_or_missing_file(tmp_cfg_dir: Path) -> None:
+    class V1(BaseModel):
+        x: int = 1
+
+    class V2(BaseModel):
+        x: int = 1
+        y: int = 2
+
+    AstrbotConfigEntry[V1].bind(
+        group="g", name="schema", default=V1(), description="d", cfg_dir=tmp_cfg_dir,
+    )
+    entry = AstrbotConfigEntry[V2].bind(
+        group="g", name="schema", default=V2(), description="d", cfg_dir=tmp_cfg_dir,
+    )
+    assert entry.cfg_file is not None
+    # 文件缺少新增字段, 应重写
+    entry.save()
+    assert "y = 2" in entry.cfg_file.read_text(encoding="utf-8")
+    # 文件被删除后 save/reset 应重新创建
+    entry.cfg_file.unlink()
+    entry.save()
+    assert entry.cfg_file.exists()
+    entry.cfg_file.unlink()
+    entry.reset()
+    assert entry.cfg_file.exists()
+
+
+def test_load_from_file(tmp_cfg_dir: Path) -> None:
+    entry = AstrbotConfigEntry[SubConfig].bind(
+        group="g",
+        name="load",
+        default=SubConfig(),
+        description="d",
+        cfg_dir=tmp_cfg_dir,
+    )
+    assert entry.cfg_file is not None
+    text = entry.cfg_file.read_text(encoding="utf-8")
+    entry.cfg_file.write_text(
+        text.replace("sub_field2 = 42", "sub_field2 = 43", 1),
+        encoding="utf-8",
+    )
+    entry.load()
+    assert entry.value.sub_field2 == 43
+    assert isinstance(entry.value, SubConfig)
+    # 刚加载的内容与文件一致, 保存不应改动文件
+    before = entry.cfg_file.read_text(encoding="utf-8")
+    entry.save()
+    assert entry.cfg_file.read_text(encoding="utf-8") == before
+
+
+def test_bind_relative_cfg_dir_follows_cwd(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first, second = tmp_path / "a", tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    for cwd in (first, second):
+        monkeypatch.chdir(cwd)
+        entry = AstrbotConfigEntry[SubConfig].bind(
+            group="g",
+            name="rel",
+            default=SubConfig(),
+            description="d",
+            cfg_dir=Path("cfg"),
+        )
+        assert entry.cfg_file == (cwd / "cfg" / "g" / "rel.toml").resolve()
+        assert entry.cfg_file.exists()
+
+
+def test_save_file_mode(tmp_cfg_dir: Path) -> None:
+    old_umask = os.umask(0o022)
+    try:
+        entry = AstrbotConfigEntry[SubConfig].bind(
+            group="g",
+            name="mode",
+            default=SubConfig(),
+            description="d",
+            cfg_dir=tmp_cfg_dir,
+        )
+    finally:
+        os.umask(old_umask)
+    assert entry.cfg_file is not None
+    assert entry.cfg_file.stat().st_mode & 0o777 == 0o644
+    # 不应遗留临时文件
+    assert [p.name for p in entry.cfg_file.parent.iterdir()] == ["mode.toml"]
+
+
+def test_save_keeps_existing_file_mode(tmp_cfg_dir: Path) -> None:
+    entry = AstrbotConfigEntry[SubConfig].bind(
+        group="g",
+        name="private",
+        default=SubConfig(),
+        description="d",
+        cfg_dir=tmp_cfg_dir,
+    )
+    assert entry.cfg_file is not None
+    entry.cfg_file.chmod(0o600)
+    entry.value.sub_field2 = 3
+    entry.save()
+    assert entry.cfg_file.stat().st_mode & 0o777 == 0o600
+    assert "sub_field2 = 3" in entry.cfg_file.read_text(encoding="utf-8")
+
+
+class OptionalConfig(BaseModel):
+    token: str | None = None
+    retries: int = 3
+
+
+def test_save_skips_unchanged_none_fields(tmp_cfg_dir: Path) -> None:
+    AstrbotConfigEntry[OptionalConfig].bind(
+        group="g",
+        name="optional",
+        default=OptionalConfig(),
+        description="d",
+        cfg_dir=tmp_cfg_dir,
+    )
+    entry = AstrbotConfigEntry[OptionalConfig].bind(
+        group="g",
+        name="optional",
+        default=OptionalConfig(),
+        description="d",
+        cfg_dir=tmp_cfg_dir,
+    )
+    assert entry.cfg_file is not None
+    assert entry.value.token is None
+    entry.cfg_file.write_text("# 外部修改\n", encoding="utf-8")
+    # None 字段不会写入文件, 值未变化时不应重写
+    entry.save()
+    assert entry.cfg_file.read_text(encoding="utf-8") == "# 外部修改\n"
+
+
+def test_bind_follows_repointed_root(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    root = tmp_path / "root"
+    root.symlink_to(first, target_is_directory=True)
+    entry = AstrbotConfigEntry[SubConfig].bind(
+        group="g",
+        name="linked",
+        default=SubConfig(),
+        description="d",
+        cfg_dir=root,
+    )
+    assert entry.cfg_file == first / "g" / "linked.toml"
+    # 根目录改指到其它目录后, 不应沿用缓存的解析结果
+    root.unlink()
+    root.symlink_to(second, target_is_directory=True)
+    entry = AstrbotConfigEntry[SubConfig].bind(
+        group="g",
+        name="linked",
+        default=SubConfig(),
+        description="d",
+        cfg_dir=root,
+    )
+    assert entry.cfg_file == second / "g" / "linked.toml"
+    assert entry.cfg_file.exists()
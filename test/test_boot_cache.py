@@ -0,0 +1,54 @@
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+
+from astrbot_canary.core.boot_cache import (
+    load_boot_cache,
+    read_boot_cache,
+    save_boot_cache,
+)
+
+GROUP = "astrbot.modules"
+
+
+def test_boot_cache_roundtrip(tmp_path: Path) -> None:
+    cache_file = tmp_path / "boot_resolve.json"
+    eps = [
+        EntryPoint(name="canary_core", value="a.b:C", group=f"{GROUP}.core"),
+        EntryPoint(name="canary_plugin", value="d.e:F", group=GROUP),
+    ]
+    assert read_boot_cache(cache_file, GROUP) is None
+    assert load_boot_cache(None, ["canary_core"]) is None
+    save_boot_cache(cache_file, GROUP, ["canary_core"], eps)
+    cache = read_boot_cache(cache_file, GROUP)
+    # 各入口点按原来的组还原
+    assert load_boot_cache(cache, ["canary_core"]) == eps
+    # boot 配置变化时缓存失效
+    assert load_boot_cache(cache, ["canary_web"]) is None
+
+
+def test_boot_cache_corrupted(tmp_path: Path) -> None:
+    cache_file = tmp_path / "boot_resolve.json"
+    cache_file.write_text("not json")
+    assert read_boot_cache(cache_file, GROUP) is None
+
+
+def test_boot_cache_fresh(tmp_path: Path) -> None:
+    cache_file = tmp_path / "boot.json"
+    assert read_boot_cache(cache_file, GROUP) is None
+    save_boot_cache(cache_file, GROUP, [], [])
+    assert read_boot_cache(cache_file, GROUP) is not None
+    assert read_boot_cache(cache_file, "other.group") is None
+
+
+def test_boot_cache_ignores_cwd(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_file = tmp_path / "boot.json"
+    monkeypatch.syspath_prepend("")
+    save_boot_cache(cache_file, GROUP, [], [])
+    # 空字符串代表当前工作目录, 切换目录后缓存仍有效
+    monkeypatch.chdir(tmp_path)
+    assert read_boot_cache(cache_file, GROUP) is not None
@@ -1,15 +1,38 @@
+import os
 import shutil
+from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 from astrbot_canary_paths import AstrbotPaths
 
+
+def _reset_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    """恢复到未初始化状态: 按当前 ASTRBOT_ROOT 确定根目录, 清空共享实例."""
+    root = Path(os.getenv("ASTRBOT_ROOT", Path.home() / ".astrbot")).absolute()
+    monkeypatch.setattr(AstrbotPaths, "astrbot_root", root)
+    monkeypatch.setattr(AstrbotPaths, "_unset_root", root)
+    monkeypatch.setattr(AstrbotPaths, "_initialized", False)
+    monkeypatch.setattr(AstrbotPaths, "_dotenv_mtime", None)
+    AstrbotPaths._shared.cache_clear()  # noqa: SLF001
+
+
+@pytest.fixture(autouse=True)
+def reset_paths(monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
+    # 每个测试从未初始化状态开始, 结果与执行顺序无关
+    _reset_paths(monkeypatch)
+    yield
+    AstrbotPaths._shared.cache_clear()  # noqa: SLF001
+
+
 def test_astrbot_canary_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     # 设置环境变量，确保 astrbot_root 在临时目录下
     monkeypatch.setenv("ASTRBOT_ROOT", str(tmp_path / ".astrbot_test"))
+    _reset_paths(monkeypatch)
     pypi_name = "testmod"
     paths = AstrbotPaths.getPaths(pypi_name)
     # 检查根目录
+    assert paths.astrbot_root == tmp_path / ".astrbot_test"
     assert paths.astrbot_root.exists()
     # 检查 config 目录
     config_dir = paths.config
@@ -25,3 +48,58 @@ def test_astrbot_canary_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -
     assert log_dir.name == pypi_name
     # 清理
     shutil.rmtree(tmp_path / ".astrbot_test", ignore_errors=True)
+
+
+def test_astrbot_canary_paths_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # 属性结果应被缓存, reload 后重新计算
+    monkeypatch.setattr(AstrbotPaths, "astrbot_root", tmp_path / ".astrbot_cached")
+    paths = AstrbotPaths.getPaths("cachedmod")
+    other = AstrbotPaths.getPaths("othermod")
+    assert paths.data is paths.data
+    assert other.data == tmp_path / ".astrbot_cached" / "data" / "othermod"
+    monkeypatch.setenv("ASTRBOT_ROOT", str(tmp_path / ".astrbot_reloaded"))
+    paths.reload()
+    assert paths.data == tmp_path / ".astrbot_reloaded" / "data" / "cachedmod"
+    assert paths.data.exists()
+    # reload 对共享根目录的所有实例生效
+    assert other.data == tmp_path / ".astrbot_reloaded" / "data" / "othermod"
+
+
+def test_astrbot_canary_paths_new_instance_recreates(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(AstrbotPaths, "astrbot_root", tmp_path / ".astrbot_new")
+    data = AstrbotPaths("newmod").data
+    shutil.rmtree(data)
+    # 新实例应重新创建被删除的目录
+    assert AstrbotPaths("newmod").data.exists()
+
+
+def test_astrbot_canary_paths_interned() -> None:
+    assert AstrbotPaths.getPaths("internmod") is AstrbotPaths.getPaths("internmod")
+
+
+def test_reload_picks_up_changed_dotenv(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from astrbot_canary_paths import paths as paths_module
+
+    dotenv = tmp_path / ".env"
+    dotenv.write_text(f"ASTRBOT_ROOT={tmp_path / 'first'}\n", encoding="utf-8")
+    monkeypatch.setattr(paths_module, "_dotenv_path", lambda: str(dotenv))
+    monkeypatch.delenv("ASTRBOT_ROOT", raising=False)
+    paths = AstrbotPaths.getPaths("dotenvmod")
+    assert paths.astrbot_root == tmp_path / "first"
+    dotenv.write_text(f"ASTRBOT_ROOT={tmp_path / 'second'}\n", encoding="utf-8")
+    os.utime(dotenv, ns=(0, 10**9))
+    paths.reload()
+    assert paths.data == tmp_path / "second" / "data" / "dotenvmod"
+
+
+def test_get_paths_shared_by_normalized_name() -> None:
+    paths = AstrbotPaths.getPaths("astrbot_canary")
+    assert AstrbotPaths.getPaths("AstrBot-Canary") is paths
+    assert AstrbotPaths.getPaths("astrbot.canary") is paths
+    assert paths.name == "astrbot-canary"
@@ -0,0 +1,66 @@
+from importlib.metadata import EntryPoint, EntryPoints
+
+from astrbot_canary.__main__ import AstrbotRootModule
+
+
+def test_group_entry_points_by_group_name() -> None:
+    eps = EntryPoints(
+        [
+            # 模块路径不存在, 按组名声明类型时不应被导入
+            EntryPoint("web", "missing_astrbot_web:Module", "astrbot.modules.web"),
+            EntryPoint("tui", "missing_astrbot_tui:Module", "astrbot.modules.tui"),
+            EntryPoint("core", "missing_astrbot_core:Module", "astrbot.modules.core"),
+        ],
+    )
+    unknown, core, loader, web, tui = AstrbotRootModule.group_entry_points(eps)
+    assert unknown == []
+    assert loader == []
+    assert [ep.name for ep in core] == ["core"]
+    assert [ep.name for ep in web] == ["web"]
+    assert [ep.name for ep in tui] == ["tui"]
+
+
+def test_group_entry_points_loads_untyped_group() -> None:
+    # 通用组中的入口点需导入后读取 module_type
+    eps = EntryPoints(
+        [
+            EntryPoint(
+                "root",
+                "astrbot_canary.__main__:AstrbotRootModule",
+                "astrbot.modules",
+            ),
+        ],
+    )
+    _, core, *_ = AstrbotRootModule.group_entry_points(eps)
+    assert [ep.name for ep in core] == ["root"]
+
+
+def test_load_entry_points_collects_failures() -> None:
+    group = "astrbot.modules"
+    ok = EntryPoint("root", "astrbot_canary.__main__:AstrbotRootModule", group)
+    bad = EntryPoint("bad", "missing_astrbot_module:Module", group)
+    loaded, failed = AstrbotRootModule._load_entry_points([ok, bad])  # noqa: SLF001
+    assert loaded == [AstrbotRootModule]
+    assert [ep.name for ep, _ in failed] == ["bad"]
+    assert isinstance(failed[0][1], ImportError)
+
+
+def test_load_entry_points_retries_failures_serially() -> None:
+    # 模拟线程池中因并发导入而失败, 串行重试成功的入口点
+    calls: list[str] = []
+
+    class FailOnce(EntryPoint):
+        def load(self) -> object:
+            calls.append(self.name)
+            if len(calls) == 1:
+                msg = "deadlock detected"
+                raise RuntimeError(msg)
+            return super().load()
+
+    ep = FailOnce(
+        "root", "astrbot_canary.__main__:AstrbotRootModule", "astrbot.modules",
+    )
+    loaded, failed = AstrbotRootModule._load_entry_points([ep])  # noqa: SLF001
+    assert loaded == [AstrbotRootModule]
+    assert failed == []
+    assert calls == ["root", "root"]
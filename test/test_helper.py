@@ -0,0 +1,28 @@
+from astrbot_canary_helper import AstrbotCanaryHelper
+
+
+def test_get_all_entry_points_cached() -> None:
+    group = "astrbot.modules"
+    first = AstrbotCanaryHelper.getAllEntryPoints(group)
+    assert AstrbotCanaryHelper.getAllEntryPoints(group) is first
+    # refresh 应重新扫描并使缓存失效
+    refreshed = AstrbotCanaryHelper.getAllEntryPoints(group, refresh=True)
+    assert refreshed is not first
+    assert AstrbotCanaryHelper.getAllEntryPoints(group) is refreshed
+
+
+def test_prefetch_entry_points() -> None:
+    AstrbotCanaryHelper.eps = None
+    AstrbotCanaryHelper.prefetch()
+    eps = AstrbotCanaryHelper._ensure_loaded()  # noqa: SLF001
+    assert AstrbotCanaryHelper._prefetch_thread is None  # noqa: SLF001
+    assert AstrbotCanaryHelper._ensure_loaded() is eps  # noqa: SLF001
+
+
+def test_get_single_entry_point_cached() -> None:
+    group = "astrbot.modules"
+    AstrbotCanaryHelper.clearEntryPointCache()
+    assert AstrbotCanaryHelper.getSingleEntryPoint(group, "__missing__") is None
+    assert (group, "__missing__") in AstrbotCanaryHelper._single_cache  # noqa: SLF001
+    AstrbotCanaryHelper.clearEntryPointCache()
+    assert not AstrbotCanaryHelper._single_cache  # noqa: SLF001
@@ -0,0 +1,64 @@
+from astrbot_canary_api import moduleimpl
+from astrbot_canary_api.interface import AstrbotModuleSpec
+
+from astrbot_canary.core.hooks import AstrbotModuleManager
+
+
+def _make_module(name: str, calls: list[str], **opts: bool) -> type:
+    class Module:
+        @classmethod
+        @moduleimpl(**opts)
+        def Awake(cls) -> None:
+            calls.append(name)
+
+    Module.__name__ = name
+    return Module
+
+
+def test_call_matches_pluggy_order() -> None:
+    calls: list[str] = []
+    mm = AstrbotModuleManager("astrbot.modules")
+    mm.add_hookspecs(AstrbotModuleSpec)
+    mm.register(_make_module("a", calls))
+    mm.register(_make_module("b", calls, tryfirst=True))
+    mm.register(_make_module("c", calls))
+    mm.hook.Awake()
+    expected = list(calls)
+    calls.clear()
+    assert mm.call("Awake") == []
+    assert calls == expected
+
+
+def test_call_recompiles_after_register() -> None:
+    calls: list[str] = []
+    mm = AstrbotModuleManager("astrbot.modules")
+    mm.add_hookspecs(AstrbotModuleSpec)
+    mm.register(_make_module("a", calls))
+    mm.call("Awake")
+    late = _make_module("late", calls)
+    mm.register(late)
+    mm.call("Awake")
+    assert calls == ["a", "late", "a"]
+    mm.unregister(late)
+    calls.clear()
+    mm.call("Awake")
+    assert calls == ["a"]
+
+
+def test_call_reports_to_hookcall_monitoring() -> None:
+    calls: list[str] = []
+    monitored: list[str] = []
+    mm = AstrbotModuleManager("astrbot.modules")
+    mm.add_hookspecs(AstrbotModuleSpec)
+    mm.register(_make_module("a", calls))
+    mm.call("Awake")
+    undo = mm.add_hookcall_monitoring(
+        lambda hook_name, *_: monitored.append(hook_name),
+        lambda *_: None,
+    )
+    mm.call("Awake")
+    assert monitored == ["Awake"]
+    undo()
+    mm.call("Awake")
+    assert monitored == ["Awake"]
+    assert calls == ["a", "a", "a"]
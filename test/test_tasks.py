@@ -0,0 +1,24 @@
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from astrbot_canary.core.tasks import AstrbotLazyBroker
+
+
+def _cfg(broker_type: str, backend_type: str) -> Any:  # noqa: ANN401
+    value = SimpleNamespace(broker_type=broker_type, backend_type=backend_type)
+    return SimpleNamespace(value=value)
+
+
+def test_lazy_broker_validates_on_construction() -> None:
+    with pytest.raises(ValueError, match="任务队列"):
+        AstrbotLazyBroker(_cfg("unknown", "inmemory"))
+    with pytest.raises(ValueError, match="结果后端"):
+        AstrbotLazyBroker(_cfg("inmemory", "unknown"))
+
+
+def test_lazy_broker_defers_init() -> None:
+    # 构造时不初始化任务系统, 也不导入 taskiq
+    lazy = AstrbotLazyBroker(_cfg("inmemory", "inmemory"))
+    assert lazy._broker is None  # noqa: SLF001
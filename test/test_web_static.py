@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import gzip
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+pytest.importorskip("astrbot_canary_web")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from astrbot_canary_web.frontend import AstrbotCanaryFrontend
+from astrbot_canary_web.static import AstrbotCanaryStaticFiles, _accepts_gzip
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BODY = "console.log('astrbot');\n" * 64
+
+
+@pytest.fixture
+def dist(tmp_path: Path) -> Path:
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "app.js").write_text(BODY, encoding="utf-8")
+    (dist / "logo.png").write_bytes(b"\x89PNG")
+    return dist
+
+
+@pytest.fixture
+def client(dist: Path) -> TestClient:
+    AstrbotCanaryFrontend.precompress(dist)
+    app = FastAPI()
+    app.mount("/", AstrbotCanaryStaticFiles(directory=dist), name="static")
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip", True),
+        ("br, gzip;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0, *", False),
+        ("*;q=0", False),
+        ("identity", False),
+        ("", False),
+    ],
+)
+def test_accepts_gzip(header: str, expected: bool) -> None:  # noqa: FBT001
+    assert _accepts_gzip(header) is expected
+
+
+def test_precompress(dist: Path) -> None:
+    AstrbotCanaryFrontend.precompress(dist)
+    gz_path = dist / "app.js.gz"
+    assert gzip.decompress(gz_path.read_bytes()).decode("utf-8") == BODY
+    # 非文本资源不压缩
+    assert not (dist / "logo.png.gz").exists()
+    # 不旧于源文件的 .gz 会被跳过
+    gz_path.write_bytes(gzip.compress(b"stale"))
+    source_mtime = (dist / "app.js").stat().st_mtime
+    os.utime(gz_path, (source_mtime + 10, source_mtime + 10))
+    AstrbotCanaryFrontend.precompress(dist)
+    assert gzip.decompress(gz_path.read_bytes()) == b"stale"
+
+
+def test_static_serves_precompressed(client: TestClient) -> None:
+    response = client.get("/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == BODY
+
+
+def test_static_not_modified(client: TestClient) -> None:
+    first = client.get("/app.js", headers={"Accept-Encoding": "gzip"})
+    response = client.get(
+        "/app.js",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip;q=0"])
+def test_static_without_gzip(client: TestClient, accept_encoding: str) -> None:
+    response = client.get("/app.js", headers={"Accept-Encoding": accept_encoding})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == BODY
+
+
+def test_static_skips_stale_gz_copy(client: TestClient, dist: Path) -> None:
+    source = dist / "app.js"
+    source.write_text("v2();\n", encoding="utf-8")
+    gz_mtime = (dist / "app.js.gz").stat().st_mtime
+    os.utime(source, (gz_mtime + 10, gz_mtime + 10))
+    response = client.get("/app.js", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == "v2();\n"
+
+
+def test_static_without_gz_copy(client: TestClient) -> None:
+    response = client.get("/logo.png", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    assert response.content == b"\x89PNG"
+
+
+def test_ready_marker_follows_dist(tmp_path: Path) -> None:
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    index = dist / "index.html"
+    index.write_text("<p>v1</p>", encoding="utf-8")
+    assert AstrbotCanaryFrontend.ensure(tmp_path)
+    assert AstrbotCanaryFrontend.is_ready(tmp_path)
+    # 替换前端文件后标记失效
+    index.write_text("<p>v2 build</p>", encoding="utf-8")
+    assert not AstrbotCanaryFrontend.is_ready(tmp_path)
+    assert AstrbotCanaryFrontend.ensure(tmp_path)
+    assert AstrbotCanaryFrontend.is_ready(tmp_path)
+
+
+def test_ensure_recompresses_when_ready(tmp_path: Path) -> None:
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "index.html").write_text("<p>astrbot</p>", encoding="utf-8")
+    source = dist / "app.js"
+    source.write_text("v1();\n", encoding="utf-8")
+    assert AstrbotCanaryFrontend.ensure(tmp_path)
+    source.write_text("v2();\n", encoding="utf-8")
+    gz_mtime = (dist / "app.js.gz").stat().st_mtime
+    os.utime(source, (gz_mtime + 10, gz_mtime + 10))
+    # 就绪标记仍有效, 但旧的 .gz 副本应被重新生成
+    assert AstrbotCanaryFrontend.is_ready(tmp_path)
+    assert AstrbotCanaryFrontend.ensure(tmp_path)
+    assert gzip.decompress((dist / "app.js.gz").read_bytes()) == b"v2();\n"